@@ -1,9 +1,13 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
-import re
+import hashlib
+import os
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
 
 # 페이지 설정
 st.set_page_config(
@@ -12,12 +16,53 @@ st.set_page_config(
     layout="wide"
 )
 
-# 데이터 로드 함수
-@st.cache_data
-def load_data():
+# 데이터 파일 경로
+DATA_FILE = Path("24년_운영실적.xlsx")
+
+# 파일 변경 감지용 키 (수정 시각, 크기) - 파일이 없으면 None
+def file_key(path):
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+# 전처리 결과 Parquet 캐시 디렉토리 (전처리 로직 변경 시 CACHE_VERSION 증가)
+CACHE_DIR = ".cache"
+CACHE_VERSION = 6
+
+# 사이드바 필터 컬럼
+FILTER_COLUMNS = ['시작월', '카테고리1', '과정유형', '담당자']
+
+# 카테고리별 성과지표 컬럼 (5점 척도 / 0~1 비율)
+SCORE_5 = ['과정만족도', '교육내용', '교육방법']
+SCORE_PCT = ['긍정응답율', '과정NPS', '현업적용']
+
+# 데이터 로드 함수 (데이터 파일이 바뀌면 캐시 무효화)
+# hash_funcs는 실제 타입명으로 매칭되므로 Path 대신 type(DATA_FILE) (PosixPath/WindowsPath) 사용
+@st.cache_data(hash_funcs={type(DATA_FILE): file_key})
+def load_data(path):
     try:
-        # 데이터 로드
-        df = pd.read_excel("24년_운영실적.xlsx", sheet_name="Sheet1")
+        # 엑셀 파일 해시로 Parquet 캐시 확인
+        with open(path, "rb") as f:
+            file_hash = hashlib.sha1(f.read()).hexdigest()
+        cache_path = os.path.join(CACHE_DIR, f"{file_hash}_v{CACHE_VERSION}.parquet")
+        if os.path.exists(cache_path):
+            try:
+                return pd.read_parquet(cache_path)
+            except (OSError, ValueError) as e:
+                # 캐시 손상 시 파일을 삭제하고 엑셀에서 다시 로드
+                logger.warning("Parquet 캐시를 읽지 못해 삭제합니다 (%s): %s", cache_path, e)
+                try:
+                    os.remove(cache_path)
+                except OSError:
+                    pass
+
+        # 데이터 로드 (calamine 엔진 미설치 시 기본 openpyxl 엔진 사용)
+        try:
+            df = pd.read_excel(path, sheet_name="Sheet1", engine="calamine")
+        except ImportError:
+            df = pd.read_excel(path, sheet_name="Sheet1")
         
         # # 데이터프레임 정보 출력
         # st.write("데이터프레임 컬럼:", df.columns.tolist())
@@ -32,25 +77,17 @@ def load_data():
             st.error(f"필수 컬럼이 누락되었습니다: {missing_columns}")
             return None
             
-        # 시작월 데이터 처리
-        def convert_month(month_str):
-            try:
-                # '01월' 형식의 문자열에서 숫자만 추출
-                month_num = re.sub(r'[^0-9]', '', str(month_str))
-                if month_num:
-                    # 2024년을 기준으로 날짜 생성
-                    return f"2024-{month_num.zfill(2)}"
-                return "2024-01"  # 기본값 설정
-            except:
-                return "2024-01"  # 에러 발생 시 기본값 설정
-
-        df['시작월'] = df['시작월'].apply(convert_month)
+        # 시작월 데이터 처리: '01월' 형식의 문자열에서 숫자만 추출해 2024년 기준 'YYYY-MM' 생성
+        # (숫자가 없으면 '2024-01' 기본값)
+        month_num = df['시작월'].astype(str).str.replace(r'[^0-9]', '', regex=True)
+        df['시작월'] = '2024-' + month_num.mask(month_num == '', '1').str.zfill(2)
         
-        # 데이터 타입 변환
-        df['참석인원'] = pd.to_numeric(df['참석인원'], errors='coerce').fillna(0)
-        df['이수인원'] = pd.to_numeric(df['이수인원'], errors='coerce').fillna(0)
+        # 데이터 타입 변환 (인원 수는 정수면 int32, 아니면 float32로 축소)
+        for col in ['참석인원', '이수인원']:
+            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+            df[col] = df[col].astype('int32' if (df[col] % 1 == 0).all() else 'float32')
         
-        # 선택적 컬럼 처리
+        # 선택적 컬럼 처리 (float32로 저장)
         optional_columns = {
             '과정만족도': 0,
             '현업적용율': 0,
@@ -60,20 +97,97 @@ def load_data():
         
         for col, default_value in optional_columns.items():
             if col not in df.columns:
-                df[col] = default_value
+                df[col] = np.float32(default_value)
+            else:
+                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0).astype('float32')
+        
+        # 성과지표 컬럼 미존재시 NaN으로 추가 및 숫자형 변환 (fillna(0) 제거)
+        for col in SCORE_5 + SCORE_PCT:
+            if col not in df.columns:
+                df[col] = np.nan
             else:
-                df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+                df[col] = pd.to_numeric(df[col], errors='coerce')
+        
+        # 필터 컬럼은 범주형으로 변환 (카테고리가 정렬된 상태로 보관되어 필터 목록 정렬 불필요)
+        for col in FILTER_COLUMNS:
+            df[col] = pd.Categorical(df[col])
+        
+        # 나머지 object 컬럼은 문자열형으로 통일 (숫자/문자 혼재 컬럼도 Parquet 저장 가능하도록)
+        object_columns = df.select_dtypes(include='object').columns
+        df[object_columns] = df[object_columns].astype('string')
+        
+        # 전처리 결과를 Parquet 캐시로 저장 (실패해도 대시보드는 계속 동작)
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            df.to_parquet(cache_path)
+        except (OSError, ValueError, TypeError, ImportError) as e:
+            logger.warning("Parquet 캐시 저장에 실패했습니다 (%s): %s", cache_path, e)
+            # 쓰다 만 캐시 파일이 남지 않도록 삭제
+            try:
+                os.remove(cache_path)
+            except OSError:
+                pass
         
         return df
     except FileNotFoundError:
-        st.error("데이터 파일을 찾을 수 없습니다. '24년_운영실적.xlsx' 파일이 프로젝트 루트 디렉토리에 있는지 확인해주세요.")
+        st.error(f"데이터 파일을 찾을 수 없습니다. '{path}' 파일이 프로젝트 루트 디렉토리에 있는지 확인해주세요.")
         return None
     except Exception as e:
         st.error(f"데이터 로드 중 오류가 발생했습니다: {str(e)}")
         return None
 
+# 필터 컬럼별 값 -> 행 위치 인덱스 (필터 변경 시 전체 스캔 없이 조회)
+# data_key: 데이터 파일 변경 시 캐시 무효화용 (DataFrame 자체는 해시하지 않음)
+@st.cache_data
+def build_indices(_df, data_key):
+    return {col: _df.groupby(col, observed=True).indices for col in FILTER_COLUMNS}
+
+# 필터 조합별 집계 결과 캐시 (같은 필터 상태로 돌아오면 groupby 재실행 없음)
+# data_key: 데이터 파일 변경 시 캐시 무효화용, filters: 선택된 필터 값 튜플
+@st.cache_data
+def aggregate(_df, data_key, filters, key, agg):
+    return _df.groupby(key, observed=True).agg(agg).reset_index()
+
+# 수료율(%) 계산 (참석인원이 0인 경우 0으로 처리)
+def calc_completion_rate(data):
+    attended = data['참석인원'].to_numpy(dtype='float32')
+    completed = data['이수인원'].to_numpy(dtype='float32')
+    return np.divide(completed * 100, attended, out=np.zeros_like(attended), where=attended > 0)
+
+# KPI 숫자 표시 (정수값은 정수로, 그 외는 소수점 첫째 자리까지)
+def format_number(value):
+    value = float(value)
+    return int(value) if value.is_integer() else round(value, 1)
+
+# 차트 생성 함수 (집계 데이터가 같으면 캐시된 Figure 재사용, 최대 256개 보관)
+# 집계 결과를 numpy 배열로 받아 go.Figure trace를 직접 구성 (plotly.express의 DataFrame 해석 비용 제거)
+# x/labels는 문자열(dtype=str) 배열로 전달: object 배열은 캐시 키가 내용이 아닌 메모리 주소로 계산됨
+@st.cache_data(max_entries=256)
+def line_chart(x, series, title, x_title, y_title, legend_title):
+    fig = go.Figure([go.Scatter(x=x, y=y, mode='lines', name=name) for name, y in series.items()])
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title,
+                      legend_title_text=legend_title)
+    return fig
+
+@st.cache_data(max_entries=256)
+def bar_chart(x, y, title, x_title, y_title, range_y=None, show_values=False):
+    fig = go.Figure(go.Bar(x=x, y=y))
+    fig.update_layout(title=title, xaxis_title=x_title, yaxis_title=y_title)
+    if range_y is not None:
+        fig.update_yaxes(range=range_y)
+    if show_values:
+        # 바 상단에 값 표시 (float32 반올림 오차가 보이지 않도록 소수점 둘째 자리로 포맷)
+        fig.update_traces(texttemplate='%{y:.2f}', textposition='outside')
+    return fig
+
+@st.cache_data(max_entries=256)
+def pie_chart(labels, values, title):
+    fig = go.Figure(go.Pie(labels=labels, values=values))
+    fig.update_layout(title=title)
+    return fig
+
 # 데이터 로드
-df = load_data()
+df = load_data(DATA_FILE)
 
 if df is None:
     st.stop()
@@ -82,31 +196,37 @@ if df is None:
 st.sidebar.title("필터")
 
 # 월 필터
-months = sorted(df['시작월'].unique())
-selected_month = st.sidebar.selectbox("시작월", ["전체"] + list(months))
+months = df['시작월'].cat.categories.tolist()
+selected_month = st.sidebar.selectbox("시작월", ["전체"] + months)
 
 # 카테고리 필터
-categories1 = sorted(df['카테고리1'].unique())
-selected_category1 = st.sidebar.selectbox("카테고리1", ["전체"] + list(categories1))
+categories1 = df['카테고리1'].cat.categories.tolist()
+selected_category1 = st.sidebar.selectbox("카테고리1", ["전체"] + categories1)
 
 # 과정 유형 필터
-course_types = sorted(df['과정유형'].unique())
-selected_course_type = st.sidebar.selectbox("과정유형", ["전체"] + list(course_types))
+course_types = df['과정유형'].cat.categories.tolist()
+selected_course_type = st.sidebar.selectbox("과정유형", ["전체"] + course_types)
 
 # 담당자 필터
-managers = sorted(df['담당자'].unique())
-selected_manager = st.sidebar.selectbox("담당자", ["전체"] + list(managers))
-
-# 데이터 필터링
-filtered_df = df.copy()
-if selected_month != "전체":
-    filtered_df = filtered_df[filtered_df['시작월'] == selected_month]
-if selected_category1 != "전체":
-    filtered_df = filtered_df[filtered_df['카테고리1'] == selected_category1]
-if selected_course_type != "전체":
-    filtered_df = filtered_df[filtered_df['과정유형'] == selected_course_type]
-if selected_manager != "전체":
-    filtered_df = filtered_df[filtered_df['담당자'] == selected_manager]
+managers = df['담당자'].cat.categories.tolist()
+selected_manager = st.sidebar.selectbox("담당자", ["전체"] + managers)
+
+# 데이터 필터링: 선택된 값들의 행 인덱스 교집합으로 한 번에 추출
+data_key = file_key(DATA_FILE)
+filter_indices = build_indices(df, data_key)
+selected_filters = {
+    '시작월': selected_month,
+    '카테고리1': selected_category1,
+    '과정유형': selected_course_type,
+    '담당자': selected_manager
+}
+filter_key = tuple(selected_filters.items())
+row_idx = None
+for col, value in selected_filters.items():
+    if value != "전체":
+        rows = filter_indices[col].get(value, np.array([], dtype=np.intp))
+        row_idx = rows if row_idx is None else np.intersect1d(row_idx, rows, assume_unique=True)
+filtered_df = df if row_idx is None else df.take(row_idx)
 
 # 메인 타이틀
 st.title("HRD 운영 실적 대시보드")
@@ -114,163 +234,177 @@ st.title("HRD 운영 실적 대시보드")
 # 1. 전체 운영 실적 개요 (KPI 카드)
 st.header("1. 전체 운영 실적 개요")
 
+# KPI 지표를 한 번에 집계 (합계/평균)
+kpi = filtered_df[['참석인원', '이수인원', '과정만족도', '현업적용율', '교육일수', '교육시간']].agg(['sum', 'mean'])
+kpi_sum, kpi_mean = kpi.loc['sum'], kpi.loc['mean']
+
 col1, col2, col3, col4 = st.columns(4)
 
 with col1:
     st.metric("총 과정 수", len(filtered_df))
-    st.metric("총 참석인원", filtered_df['참석인원'].sum())
+    st.metric("총 참석인원", format_number(kpi_sum['참석인원']))
 
 with col2:
-    st.metric("총 이수인원", filtered_df['이수인원'].sum())
-    completion_rate = (filtered_df['이수인원'].sum() / filtered_df['참석인원'].sum() * 100) if filtered_df['참석인원'].sum() > 0 else 0
+    st.metric("총 이수인원", format_number(kpi_sum['이수인원']))
+    completion_rate = (kpi_sum['이수인원'] / kpi_sum['참석인원'] * 100) if kpi_sum['참석인원'] > 0 else 0
     st.metric("전체 수료율", f"{completion_rate:.1f}%")
 
 with col3:
-    if filtered_df['과정만족도'].sum() > 0:
-        st.metric("평균 과정 만족도", f"{filtered_df['과정만족도'].mean():.1f}")
-    if filtered_df['현업적용율'].sum() > 0:
-        st.metric("평균 현업 적용율", f"{filtered_df['현업적용율'].mean():.1f}%")
+    if kpi_sum['과정만족도'] > 0:
+        st.metric("평균 과정 만족도", f"{kpi_mean['과정만족도']:.1f}")
+    if kpi_sum['현업적용율'] > 0:
+        st.metric("평균 현업 적용율", f"{kpi_mean['현업적용율']:.1f}%")
 
 with col4:
-    if filtered_df['교육일수'].sum() > 0:
-        st.metric("총 교육 일수", filtered_df['교육일수'].sum())
-    if filtered_df['교육시간'].sum() > 0:
-        st.metric("총 교육 시간", filtered_df['교육시간'].sum())
-
-# 2. 월별 실적 분석
-st.header("2. 월별 실적 분석")
-
-# 월별 데이터 집계
-monthly_data = filtered_df.groupby('시작월').agg({
-    '참석인원': 'sum',
-    '이수인원': 'sum',
-    '과정만족도': 'mean',
-    '현업적용율': 'mean'
-}).reset_index()
-
-# 월별 참석/이수 인원 추이
-fig1 = px.line(monthly_data, x='시작월', y=['참석인원', '이수인원'],
-               title='월별 참석/이수 인원 추이',
-               labels={'value': '인원 수', 'variable': '구분'})
-st.plotly_chart(fig1, use_container_width=True)
-
-# 월별 만족도/적용율 추이 (데이터가 있는 경우에만)
-if monthly_data['과정만족도'].sum() > 0 or monthly_data['현업적용율'].sum() > 0:
-    fig2 = px.line(monthly_data, x='시작월', y=['과정만족도', '현업적용율'],
-                   title='월별 만족도/적용율 추이',
-                   labels={'value': '비율 (%)', 'variable': '구분'})
-    st.plotly_chart(fig2, use_container_width=True)
-
-# 3. 카테고리별 실적 분석
-st.header("3. 카테고리별 실적 분석")
-
-# 성과지표 컬럼 미존재시 NaN으로 추가 및 숫자형 변환 (fillna(0) 제거)
-score_5 = ['과정만족도', '교육내용', '교육방법']
-score_pct = ['긍정응답율', '과정NPS', '현업적용']
-성과지표 = score_5 + score_pct
-for col in 성과지표:
-    if col not in filtered_df.columns:
-        filtered_df[col] = np.nan
-    filtered_df[col] = pd.to_numeric(filtered_df[col], errors='coerce')
-
-# 카테고리별 데이터 집계
-category_data = filtered_df.groupby('카테고리1').agg({
-    '참석인원': 'sum',
-    '이수인원': 'sum',
-    '과정만족도': 'mean',
-    '교육내용': 'mean',
-    '교육방법': 'mean',
-    '긍정응답율': 'mean',
-    '과정NPS': 'mean',
-    '현업적용': 'mean'
-}).reset_index()
-
-# 카테고리별 참석인원
-fig3 = px.bar(category_data, x='카테고리1', y='참석인원',
-              title='카테고리별 참석인원',
-              labels={'참석인원': '참석인원 수'})
-st.plotly_chart(fig3, use_container_width=True)
-
-# 카테고리별 과정성과 지표 바차트
-for col in score_5:
-    if col in category_data.columns:
-        if (category_data[col].notna().sum() > 0 and category_data[col].sum() > 0):
-            fig = px.bar(
-                category_data, x='카테고리1', y=col,
-                title=f'카테고리별 {col} (평균, 5점 척도)',
-                labels={col: f'{col} (0~5점)'},
-                range_y=[2, 5]
-            )
-            # 바 상단에 값 표시
-            fig.update_traces(
-                text=category_data[col].round(2),
-                textposition='outside'
-            )
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info(f"'{col}' 데이터가 없습니다.")
-
-for col in score_pct:
-    if col in category_data.columns:
-        # 0~1 스케일을 0~100%로 변환
-        category_data[f'{col}_pct'] = category_data[col] * 100
-        if (category_data[col].sum() > 0):
-            fig = px.bar(category_data, x='카테고리1', y=f'{col}_pct',
-                         title=f'카테고리별 {col} (평균, %)',
-                         labels={f'{col}_pct': f'{col} (%)'},
-                         range_y=[0,100])
-            st.plotly_chart(fig, use_container_width=True)
-        else:
-            st.info(f"'{col}' 데이터가 없습니다.")
-
-# 4. 과정 유형별 실적 분석
-st.header("4. 과정 유형별 실적 분석")
-
-# 과정 유형별 데이터 집계
-course_type_data = filtered_df.groupby('과정유형').agg({
-    '참석인원': 'sum',
-    '이수인원': 'sum',
-    '과정만족도': 'mean',
-    '현업적용율': 'mean'
-}).reset_index()
-
-# 과정 유형별 참석인원 비중
-fig5 = px.pie(course_type_data, values='참석인원', names='과정유형',
-              title='과정 유형별 참석인원 비중')
-st.plotly_chart(fig5, use_container_width=True)
-
-# 과정 유형별 수료율
-course_type_data['수료율'] = (course_type_data['이수인원'] / course_type_data['참석인원'] * 100)
-fig6 = px.bar(course_type_data, x='과정유형', y='수료율',
-              title='과정 유형별 수료율',
-              labels={'수료율': '수료율 (%)'})
-st.plotly_chart(fig6, use_container_width=True)
-
-# 5. 담당자별 실적 분석
-st.header("5. 담당자별 실적 분석")
-
-# 담당자별 데이터 집계
-manager_data = filtered_df.groupby('담당자').agg({
-    '과정명': 'count',
-    '참석인원': 'sum',
-    '이수인원': 'sum',
-    '과정만족도': 'mean',
-    '현업적용율': 'mean'
-}).reset_index()
-
-# 담당자별 관리 과정 수
-fig7 = px.bar(manager_data, x='담당자', y='과정명',
-              title='담당자별 관리 과정 수',
-              labels={'과정명': '과정 수'})
-st.plotly_chart(fig7, use_container_width=True)
-
-# 담당자별 수료율
-manager_data['수료율'] = (manager_data['이수인원'] / manager_data['참석인원'] * 100)
-fig8 = px.bar(manager_data, x='담당자', y='수료율',
-              title='담당자별 수료율',
-              labels={'수료율': '수료율 (%)'})
-st.plotly_chart(fig8, use_container_width=True)
+    if kpi_sum['교육일수'] > 0:
+        st.metric("총 교육 일수", format_number(kpi_sum['교육일수']))
+    if kpi_sum['교육시간'] > 0:
+        st.metric("총 교육 시간", format_number(kpi_sum['교육시간']))
+
+# 필터 결과가 없으면 이후 집계/차트 생성 생략
+if len(filtered_df) == 0:
+    st.warning("선택한 조건에 해당하는 데이터가 없습니다.")
+    st.stop()
+
+# 2~5. 상세 분석 섹션 (선택된 섹션만 집계/차트 생성)
+sections = ["2. 월별 실적 분석", "3. 카테고리별 실적 분석", "4. 과정 유형별 실적 분석", "5. 담당자별 실적 분석"]
+selected_section = st.radio("분석 섹션", sections, horizontal=True, label_visibility="collapsed")
+
+if selected_section == sections[0]:
+    st.header("2. 월별 실적 분석")
+
+    # 월별 데이터 집계
+    monthly_data = aggregate(filtered_df, data_key, filter_key, '시작월', {
+        '참석인원': 'sum',
+        '이수인원': 'sum',
+        '과정만족도': 'mean',
+        '현업적용율': 'mean'
+    })
+
+    month_x = monthly_data['시작월'].to_numpy(dtype=str)
+
+    # 월별 참석/이수 인원 추이
+    fig1 = line_chart(month_x,
+                      {col: monthly_data[col].to_numpy() for col in ['참석인원', '이수인원']},
+                      title='월별 참석/이수 인원 추이',
+                      x_title='시작월', y_title='인원 수', legend_title='구분')
+    st.plotly_chart(fig1, use_container_width=True)
+
+    # 월별 만족도/적용율 추이 (데이터가 있는 경우에만)
+    quality_series = {col: monthly_data[col].to_numpy() for col in ['과정만족도', '현업적용율']}
+    if any(np.nansum(y) > 0 for y in quality_series.values()):
+        fig2 = line_chart(month_x, quality_series,
+                          title='월별 만족도/적용율 추이',
+                          x_title='시작월', y_title='비율 (%)', legend_title='구분')
+        st.plotly_chart(fig2, use_container_width=True)
+
+elif selected_section == sections[1]:
+    st.header("3. 카테고리별 실적 분석")
+
+    # 카테고리별 데이터 집계
+    category_data = aggregate(filtered_df, data_key, filter_key, '카테고리1', {
+        '참석인원': 'sum',
+        '이수인원': 'sum',
+        '과정만족도': 'mean',
+        '교육내용': 'mean',
+        '교육방법': 'mean',
+        '긍정응답율': 'mean',
+        '과정NPS': 'mean',
+        '현업적용': 'mean'
+    })
+
+    category_x = category_data['카테고리1'].to_numpy(dtype=str)
+
+    # 카테고리별 참석인원
+    fig3 = bar_chart(category_x, category_data['참석인원'].to_numpy(),
+                     title='카테고리별 참석인원',
+                     x_title='카테고리1', y_title='참석인원 수')
+    st.plotly_chart(fig3, use_container_width=True)
+
+    # 카테고리별 과정성과 지표 바차트
+    for col in SCORE_5:
+        if col in category_data.columns:
+            y = category_data[col].to_numpy()
+            if np.nansum(y) > 0:
+                fig = bar_chart(
+                    category_x, y,
+                    title=f'카테고리별 {col} (평균, 5점 척도)',
+                    x_title='카테고리1', y_title=f'{col} (0~5점)',
+                    range_y=[2, 5],
+                    show_values=True
+                )
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.info(f"'{col}' 데이터가 없습니다.")
+
+    for col in SCORE_PCT:
+        if col in category_data.columns:
+            # 0~1 스케일을 0~100%로 변환
+            y_pct = category_data[col].to_numpy() * 100
+            if np.nansum(y_pct) > 0:
+                fig = bar_chart(category_x, y_pct,
+                                title=f'카테고리별 {col} (평균, %)',
+                                x_title='카테고리1', y_title=f'{col} (%)',
+                                range_y=[0,100])
+                st.plotly_chart(fig, use_container_width=True)
+            else:
+                st.info(f"'{col}' 데이터가 없습니다.")
+
+elif selected_section == sections[2]:
+    st.header("4. 과정 유형별 실적 분석")
+
+    # 과정 유형별 데이터 집계
+    course_type_data = aggregate(filtered_df, data_key, filter_key, '과정유형', {
+        '참석인원': 'sum',
+        '이수인원': 'sum',
+        '과정만족도': 'mean',
+        '현업적용율': 'mean'
+    })
+
+    # 과정 유형별 참석인원 비중
+    course_type_x = course_type_data['과정유형'].to_numpy(dtype=str)
+    fig5 = pie_chart(course_type_x, course_type_data['참석인원'].to_numpy(),
+                     title='과정 유형별 참석인원 비중')
+    st.plotly_chart(fig5, use_container_width=True)
+
+    # 과정 유형별 수료율
+    fig6 = bar_chart(course_type_x, calc_completion_rate(course_type_data),
+                     title='과정 유형별 수료율',
+                     x_title='과정유형', y_title='수료율 (%)')
+    st.plotly_chart(fig6, use_container_width=True)
+
+elif selected_section == sections[3]:
+    st.header("5. 담당자별 실적 분석")
+
+    # 담당자별 데이터 집계
+    manager_data = aggregate(filtered_df, data_key, filter_key, '담당자', {
+        '과정명': 'count',
+        '참석인원': 'sum',
+        '이수인원': 'sum',
+        '과정만족도': 'mean',
+        '현업적용율': 'mean'
+    })
+
+    manager_x = manager_data['담당자'].to_numpy(dtype=str)
+
+    # 담당자별 관리 과정 수
+    fig7 = bar_chart(manager_x, manager_data['과정명'].to_numpy(),
+                     title='담당자별 관리 과정 수',
+                     x_title='담당자', y_title='과정 수')
+    st.plotly_chart(fig7, use_container_width=True)
+
+    # 담당자별 수료율
+    fig8 = bar_chart(manager_x, calc_completion_rate(manager_data),
+                     title='담당자별 수료율',
+                     x_title='담당자', y_title='수료율 (%)')
+    st.plotly_chart(fig8, use_container_width=True)
 
 # 상세 데이터 테이블
 st.header("상세 데이터")
-st.dataframe(filtered_df, use_container_width=True) 
\ No newline at end of file
+
+# 브라우저로 전송하는 행 수 제한 (기본 500행)
+if len(filtered_df) > 100:
+    display_rows = st.slider("표시 행 수", 100, len(filtered_df), min(500, len(filtered_df)))
+else:
+    display_rows = len(filtered_df)
+st.dataframe(filtered_df.head(display_rows), use_container_width=True, height=400) 
\ No newline at end of file